@@ -43,7 +43,6 @@ except ImportError:
     import ConfigParser as configparser  # python2
 import logging
 import os
-import re
 import readline
 import sys
 
@@ -143,30 +142,24 @@ class CommandParser(object):
             "state"],
     }
 
-    def __init__(self, connInfo, read_only):
-        """
-        Initialize shared metadata, including list of supported commands.
+    # dispatch table for top-level commands, the set of commands is fixed
+    # so there is no need to rebuild the table for every parser instance,
+    # values are names of parsing methods
+    _funcMap = {
+        'CREATE': '_parseCreate',
+        'DELETE': '_parseDelete',
+        'DROP': '_parseDrop',
+        'DUMP': '_parseDump',
+        'EXIT': '_justExit',
+        'HELP': '_printHelp',
+        'QUIT': '_justExit',
+        'RELEASE': '_parseRelease',
+        'RESTORE': '_restore',
+        'SHOW': '_parseShow',
+        'UPDATE': '_parseUpdate'
+    }
 
-        @param connInfo     Connection information.
-        @param read_only    Disable modification if True.
-        """
-        self._initLogging()
-        self._funcMap = {
-            'CREATE': self._parseCreate,
-            'DELETE': self._parseDelete,
-            'DROP': self._parseDrop,
-            'DUMP': self._parseDump,
-            'EXIT': self._justExit,
-            'HELP': self._printHelp,
-            'QUIT': self._justExit,
-            'RELEASE': self._parseRelease,
-            'RESTORE': self._restore,
-            'SHOW': self._parseShow,
-            'UPDATE': self._parseUpdate
-        }
-        config = cssConfig.configFromUrl(connInfo)
-        self._css = css.CssAccess.createFromConfig(config, "", read_only)
-        self._supportedCommands = """
+    _supportedCommands = """
   Supported commands:
     CREATE DATABASE <dbName> <configFile>;
     CREATE DATABASE <dbName> LIKE <dbName2>;
@@ -191,6 +184,17 @@ class CommandParser(object):
     EXIT;
     ...more coming soon
 """
+
+    def __init__(self, connInfo, read_only):
+        """
+        Initialize shared metadata, including list of supported commands.
+
+        @param connInfo     Connection information.
+        @param read_only    Disable modification if True.
+        """
+        self._initLogging()
+        config = cssConfig.configFromUrl(connInfo)
+        self._css = css.CssAccess.createFromConfig(config, "", read_only)
         # only prompt if input comes from terminal
         self._prompt = "qserv > " if sys.stdin.isatty() else ""
 
@@ -208,13 +212,14 @@ class CommandParser(object):
             cmd += line + ' '
             if prompt:
                 prompt = self._prompt if line.endswith(';') else "~ "
-            while re.search(';', cmd):
-                pos = cmd.index(';')
+            pos = cmd.find(';')
+            while pos >= 0:
                 try:
                     self.parse(cmd[:pos])
                 except (_ToolError, css.CssError) as exc:
                     self._logger.error("%s", exc)
                 cmd = cmd[pos+1:]
+                pos = cmd.find(';')
 
     def parse(self, cmd):
         """
@@ -228,7 +233,7 @@ class CommandParser(object):
         tokens = cmd.split()
         t = tokens[0].upper()
         if t in self._funcMap:
-            self._funcMap[t](tokens[1:])
+            getattr(self, self._funcMap[t])(tokens[1:])
         else:
             raise _NotImplementedError(cmd)
 
@@ -578,8 +583,9 @@ class CommandParser(object):
         config.read(fName)
         xx = {}
         for section in config.sections():
-            for option in config.options(section):
-                xx[option] = config.get(section, option)
+            # items() fetches the whole section in one call instead of
+            # one get() per option
+            xx.update(config.items(section))
         return xx
 
     def _checkExist(self, opts, required):
@@ -598,7 +604,7 @@ class CommandParser(object):
         # these are required options for createDb
         self._checkExist(opts, CommandParser.requiredOpts["createDb"])
         if opts["partitioning"] != "0":
-            if opts["partitioningStrategy"].lower() == "sphBox".lower():
+            if opts["partitioningStrategy"].lower() == "sphbox":
                 self._checkExist(opts,
                                  CommandParser.requiredOpts["createDbSphBox"])
             else:
@@ -672,11 +678,19 @@ class WordCompleter(object):
 
     def __init__(self, words):
         self.words = words
+        self._matches = []
 
     def complete(self, text, state):
-        results = [word+' ' for word in self.words
-                   if word.startswith(text.upper())] + [None]
-        return results[state]
+        # readline calls this once per candidate with increasing state,
+        # compute the matches for state 0 only and reuse them after that
+        if state == 0:
+            # upcase the typed text once, not once per candidate word
+            prefix = text.upper()
+            self._matches = [word+' ' for word in self.words
+                             if word.startswith(prefix)]
+        if state < len(self._matches):
+            return self._matches[state]
+        return None
 
 
 readline.parse_and_bind("tab: complete")
@@ -64,10 +64,14 @@ class ChunkMapping(object):
                              can be None, but this is only useful for testing.
         """
         self.css = css
-        self.workers = workers[:]   # need a copy, will modify
+        self.workers = workers[:]   # keep our own copy
         self.database = database
         self.table = table
 
+        # worker() is called once per chunk, avoid rebuilding this set there
+        self._workerSet = frozenset(self.workers)
+        self._nextWorker = 0    # round-robin position for new chunks
+
         self.allChunks = {}  # maps chunk number to the set of workers (for all tables)
         self.chunks = {}  # maps chunk number to the set of workers (for current table)
         self.newChunks = {}     # maps chunk number to the worker name for new chunks
@@ -131,7 +135,7 @@ class ChunkMapping(object):
         if workers is not None:
             self._log.debug('Chunk found in existing table chunks')
             # try to chose one worker which is also in self.workers
-            match = set(self.workers) & workers
+            match = self._workerSet & workers
             if match:
                 worker = next(iter(match))
             else:
@@ -144,7 +148,7 @@ class ChunkMapping(object):
         if workers is not None:
             self._log.debug('Chunk found in existing other-table chunks')
             # try to chose one worker which is also in self.workers
-            match = set(self.workers) & workers
+            match = self._workerSet & workers
             if match:
                 worker = next(iter(match))
             else:
@@ -174,6 +178,6 @@ class ChunkMapping(object):
         """
         Get next "best" available worker, for now do round-robin.
         """
-        worker = self.workers.pop(0)
-        self.workers.append(worker)
+        worker = self.workers[self._nextWorker]
+        self._nextWorker = (self._nextWorker + 1) % len(self.workers)
         return worker
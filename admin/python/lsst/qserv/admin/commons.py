@@ -69,9 +69,9 @@ def read_user_config():
 
 def read_config(config_file):
 
-    _LOG.debug('Reading config file %r' % config_file)
+    _LOG.debug('Reading config file %r', config_file)
     if not os.path.isfile(config_file):
-        _LOG.fatal("qserv configuration file not found: %r" % config_file)
+        _LOG.fatal("qserv configuration file not found: %r", config_file)
         exit(1)
 
     parser = configparser.SafeConfigParser()
@@ -81,12 +81,13 @@ def read_config(config_file):
     _LOG.debug("Build configuration : ")
     for section in parser.sections():
         _LOG.debug("===")
-        _LOG.debug("[%r]" % section)
+        _LOG.debug("[%r]", section)
         _LOG.debug("===")
         config[section] = dict()
         for option in parser.options(section):
-            _LOG.debug("%r = %r" % (option, parser.get(section, option)))
-            config[section][option] = parser.get(section, option)
+            value = parser.get(section, option)
+            _LOG.debug("%r = %r", option, value)
+            config[section][option] = value
 
     # normalize directories names
     for section in config:
@@ -149,18 +150,18 @@ def run_command(cmd_args, stdin_file=None, stdout=None, stderr=None,
     """
 
     cmd_str = ' '.join(cmd_args)
-    _LOG.log(loglevel, "Run shell command: {0}".format(cmd_str))
+    _LOG.log(loglevel, "Run shell command: %s", cmd_str)
 
     sin = None
     if stdin_file:
-        _LOG.log(loglevel, "stdin file: %r" % stdin_file)
+        _LOG.log(loglevel, "stdin file: %r", stdin_file)
         sin = open(stdin_file, "r")
 
     sout = None
     if stdout == sys.stdout:
         sout = sys.stdout
     elif stdout:
-        _LOG.log(loglevel, "stdout file: %r" % stdout)
+        _LOG.log(loglevel, "stdout file: %r", stdout)
         sout = open(stdout, "w")
     else:
         sout = subprocess.PIPE
@@ -169,7 +170,7 @@ def run_command(cmd_args, stdin_file=None, stdout=None, stderr=None,
     if stderr == sys.stderr:
         serr = sys.stderr
     elif stderr:
-        _LOG.log(loglevel, "stderr file: %r" % stderr)
+        _LOG.log(loglevel, "stderr file: %r", stderr)
         serr = open(stderr, "w")
     else:
         serr = subprocess.PIPE
@@ -188,14 +189,14 @@ def run_command(cmd_args, stdin_file=None, stdout=None, stderr=None,
 
         if process.returncode != 0:
             _LOG.fatal(
-                "Error code returned by command : {0} ".format(cmd_str))
+                "Error code returned by command : %s ", cmd_str)
             sys.exit(1)
 
     except OSError as e:
-        _LOG.fatal("Error: %r while running command: %r" %
-                   (e, cmd_str))
+        _LOG.fatal("Error: %r while running command: %r",
+                   e, cmd_str)
         sys.exit(1)
     except ValueError as e:
-        _LOG.fatal("Invalid parameter: %r for command: %r" %
-                   (e, cmd_str))
+        _LOG.fatal("Invalid parameter: %r for command: %r",
+                   e, cmd_str)
         sys.exit(1)
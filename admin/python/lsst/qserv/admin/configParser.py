@@ -34,6 +34,7 @@ from __future__ import absolute_import, division, print_function
 #  Imports of standard modules --
 # --------------------------------
 from builtins import chr
+import re
 
 # -----------------------------
 # Imports for other modules --
@@ -43,6 +44,16 @@ from builtins import chr
 # Local non-exported definitions --
 # ----------------------------------
 
+# scanning is done with precompiled regular expressions so that runs of
+# characters are consumed by single C-level matches instead of being
+# examined one character at a time in Python loops
+_wsRe = re.compile(r'[\t\n\r ]*')
+_lineRe = re.compile(r'[^\r\n]*')
+_valueRe = re.compile(r'[^\x00-\x1f #,:=()\[\]{}]*')
+_hexRe = re.compile(r'[0-9A-Fa-f]+')
+# runs of ordinary characters inside quoted strings, one pattern per quote
+_quotedRunRe = dict((q, re.compile(r'[^\\%s]+' % q)) for q in '\'"')
+
 # ------------------------
 # Exported definitions --
 # ------------------------
@@ -70,21 +81,13 @@ class ConfigParser(object):
         """
         Skips all whitespace characters in an input
         """
-        while self._cur < self._end:
-            c = self._data[self._cur]
-            if c not in '\t\n\r ':
-                break
-            self._cur += 1
+        self._cur = _wsRe.match(self._data, self._cur).end()
 
     def _skipLine(self):
         """
         Skips until after new-line character
         """
-        while self._cur < self._end:
-            c = self._data[self._cur]
-            if c in '\r\n':
-                break
-            self._cur += 1
+        self._cur = _lineRe.match(self._data, self._cur).end()
 
     def _join(self, keys):
         """
@@ -101,18 +104,14 @@ class ConfigParser(object):
         """
         get next unquoted value from a file
         """
-        val = ""
-        while self._cur < self._end:
-            c = self._data[self._cur]
-            if c in "\t\n\r #,:=()[]{}":
-                return val
-            elif ord(c) < 0x20:
-                raise ValueError("Unquoted values must not "
-                                 "contain control characters.")
-            val += c
-            self._cur += 1
-
-        return val
+        match = _valueRe.match(self._data, self._cur)
+        self._cur = match.end()
+        if self._cur < self._end and self._data[self._cur] not in "\t\n\r #,:=()[]{}":
+            # only control characters are excluded from the value pattern
+            # without also being terminators
+            raise ValueError("Unquoted values must not "
+                             "contain control characters.")
+        return match.group()
 
     def _parseUnicodeEscape(self):
         """
@@ -120,21 +119,13 @@ class ConfigParser(object):
         """
         # Extract 1-4 hexadecimal digits to build a Unicode
         # code-point in the Basic Multilingual Plane.
-        val = ""
-        end = min(self._end, self._cur + 4)
-        while self._cur < end:
-            c = self._data[self._cur]
-            if c in '0123456789ABCDEFabcdef':
-                val += c
-            else:
-                break
-            self._cur += 1
-
-        if not val:
+        match = _hexRe.match(self._data, self._cur, min(self._end, self._cur + 4))
+        if match is None:
             raise ValueError("Invalid unicode escape in quoted value")
+        self._cur = match.end()
 
         # code point
-        cp = int(val, 16)
+        cp = int(match.group(), 16)
 
         # UTF-8 encode the code-point.
         val = chr(cp).encode('utf_8')
@@ -145,8 +136,15 @@ class ConfigParser(object):
         """
         Extracts value of a quoted string.
         """
-        val = ""
+        runRe = _quotedRunRe[quote]
+        pieces = []
         while True:
+            # consume run of ordinary characters with a single match
+            match = runRe.match(self._data, self._cur)
+            if match is not None:
+                pieces.append(match.group())
+                self._cur = match.end()
+
             if self._cur >= self._end:
                 raise ValueError("Unmatched quote character.")
 
@@ -154,21 +152,21 @@ class ConfigParser(object):
             self._cur += 1
             if c == quote:
                 break
-            elif c == '\\':
-                # Handle escape sequence.
-                if self._cur >= self._end:
-                    raise ValueError("Unmatched quote character.")
 
-                c = self._data[self._cur]
-                self._cur += 1
-                if c == 'u':
-                    c = self._parseUnicodeEscape()
-                else:
-                    c = self.escapes.get(c, c)
+            # Handle escape sequence.
+            if self._cur >= self._end:
+                raise ValueError("Unmatched quote character.")
+
+            c = self._data[self._cur]
+            self._cur += 1
+            if c == 'u':
+                c = self._parseUnicodeEscape()
+            else:
+                c = self.escapes.get(c, c)
 
-            val += c
+            pieces.append(c)
 
-        return val
+        return "".join(pieces)
 
     def parse(self):
         """
@@ -176,7 +176,7 @@ def update_root_symlinks():
                     os.unlink(default_dir)
                 else:
                     _LOG.fatal(
-                        "Please remove {0} and restart the configuration procedure".format(default_dir))
+                        "Please remove %s and restart the configuration procedure", default_dir)
                     sys.exit(1)
             _symlink(symlink_target, default_dir)
 
@@ -324,13 +324,13 @@ class Templater(object):
                 'XROOTD_PORT': config['xrootd']['xrootd_port'],
             }
 
-            _LOG.debug("Template input parameters:\n {0}".format(self._templateParams))
+            _LOG.debug("Template input parameters:\n %s", self._templateParams)
 
     def applyOnce(self, src_file, target_file, template_params=None):
         """ Creating one configuration file from one template
         """
 
-        _LOG.debug("Creating {0} from {1}".format(target_file, src_file))
+        _LOG.debug("Creating %s from %s", target_file, src_file)
 
         if template_params is None:
             self._initTemplateParams()
@@ -356,7 +356,7 @@ class Templater(object):
 
         _LOG.info("Creating configuration from templates")
         if not os.path.isdir(template_root):
-            _LOG.fatal("Template root directory: {0} doesn't exist.".format(template_root))
+            _LOG.fatal("Template root directory: %s doesn't exist.", template_root)
             sys.exit(1)
 
         for root, dirs, files in os.walk(template_root):
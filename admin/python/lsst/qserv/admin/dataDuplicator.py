@@ -74,7 +74,7 @@ class DataDuplicator(object):
             if os.path.isfile(os.path.join(self._cfgDirname, table + '.cfg')) is False:
                 self.logger.error("Path to indexing config file not found")
 
-            self.logger.info("Running indexer with output for %r to %r" % (table, self._outDirname))
+            self.logger.info("Running indexer with output for %r to %r", table, self._outDirname)
             commons.run_command(["sph-htm-index",
                                  "--config-file=" +
                                  os.path.join(self._cfgDirname, table + ".cfg"),
@@ -91,7 +91,7 @@ class DataDuplicator(object):
             if os.path.isfile(os.path.join(self._cfgDirname, 'common.cfg')) is False:
                 self.logger.error("Path to duplicator config file not found")
 
-            self.logger.info("Running duplicator for table %r" % table)
+            self.logger.info("Running duplicator for table %r", table)
             index_param = os.path.join(self._outDirname, "index", table, "htm_index.bin")
             part_index_param = os.path.join(self._outDirname, "index", self._directorTable, "htm_index.bin")
             commons.run_command(["sph-duplicate",
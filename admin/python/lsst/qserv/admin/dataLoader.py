@@ -51,6 +51,10 @@ from lsst.qserv.wmgr.client import ServerError
 # ----------------------------------
 
 
+# pattern for valid db/table names, compiled once at module level
+_identifierRe = re.compile(r'^[0-9a-zA-Z_\$]+$')
+
+
 def _mysql_identifier_validator(db_or_table_name):
     """
     Check database and table name to prevent SQL-injection
@@ -61,10 +65,7 @@ def _mysql_identifier_validator(db_or_table_name):
     @param db_or_table_name: a mysql database or table name
     @return True if name match MySQL requirements
     """
-    if not hasattr(_mysql_identifier_validator, "name_validator"):
-        name_validator = re.compile(r'^[0-9a-zA-Z_\$]+$')
-    is_correct = name_validator.match(db_or_table_name) is not None
-    return is_correct
+    return _identifierRe.match(db_or_table_name) is not None
 
 # ------------------------
 # Exported definitions --
@@ -594,12 +595,8 @@ class DataLoader(object):
         """
         Return full chunk table name or overlap table name.
         """
-        ctable = table
-        if overlap:
-            ctable += 'FullOverlap'
-        ctable += '_'
-        ctable += str(chunkId)
-        return ctable
+        suffix = 'FullOverlap_' if overlap else '_'
+        return '%s%s%s' % (table, suffix, chunkId)
 
     def _createDummyChunk(self, database, table):
         """
@@ -752,10 +749,11 @@ class DataLoader(object):
             if not os.path.isdir(emptyChunkDir):
                 raise
 
-        out = open(self.emptyChunks, 'w')
-        for chunk in range(maxChunks):
-            if chunk not in self.chunks:
-                print(chunk, file=out)
+        # single set difference instead of one membership test per chunk,
+        # and a single write instead of one line at a time
+        emptyChunks = sorted(set(range(maxChunks)) - self.chunks)
+        with open(self.emptyChunks, 'w') as out:
+            out.write(''.join('%d\n' % chunk for chunk in emptyChunks))
 
     def _makeIndex(self, database, table):
         """
@@ -833,11 +831,10 @@ class DataLoader(object):
         columns = (idxCol, 'chunkId', 'subChunkId')
         indexData = wmgr.getIndex(database, table, chunkId=chunk, columns=columns)
 
-        # dump it into a in-memory file, loadData expects binary mode
-        data = BytesIO()
-        for row in indexData:
-            data.write(b"%d\t%d\t%d\n" % tuple(row))
-        data.seek(0)
+        # dump it into a in-memory file, loadData expects binary mode,
+        # format all rows and join them in one pass
+        data = BytesIO(b"".join(b"%d\t%d\t%d\n" % (objId, chunkId, subChunkId)
+                                for objId, chunkId, subChunkId in indexData))
 
         # send that file to czar
         self.czarWmgr.loadData(self.indexDb, metaTable, data)
@@ -142,16 +142,20 @@ class NodePool(object):
 
             time.sleep(0.05)
 
-            # check for ended running_processes
+            # check for ended running_processes, rebuild the list in one
+            # pass instead of removing elements while iterating over it
+            still_running = []
             for p in running_processes:
                 process, host, p_id = p
                 if done(process):
-                    running_processes.remove(p)
                     if success(process):
                         _LOG.info("Success on %r (#%r)", host, p_id)
                     else:
                         _LOG.error("Failure on %r (#%r)", host, p_id)
                         nodes_failed.append((host, p_id))
+                else:
+                    still_running.append(p)
+            running_processes = still_running
 
         if nodes_failed:
             nb_failed = len(nodes_failed)
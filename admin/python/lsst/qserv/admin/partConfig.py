@@ -32,8 +32,8 @@ from __future__ import absolute_import, division, print_function
 # --------------------------------
 #  Imports of standard modules --
 # --------------------------------
+from collections import defaultdict
 import logging
-import itertools
 
 # -----------------------------
 # Imports for other modules --
@@ -71,37 +71,51 @@ class PartConfig(dict):
         Process all config files, throws on error
         """
 
-        dict.__init__(self)
-
-        def _options(group):
-            '''massage options list, takes list of (key, opt) pairs'''
-            options = list(opt for k, opt in group)
-            if len(options) == 1:
-                options = options[0]
-            return options
-
         for config in files:
 
-            # parse whole thing
+            # parse whole thing, options are returned as a list of (key, value)
+            # pairs, there will be more than one key appearance for some
+            # options, fold all values for each key into the accumulator in
+            # a single pass
+            merged = defaultdict(list)
             try:
-                cfgParser = ConfigParser(open(config))
-                options = cfgParser.parse()
+                with open(config) as cfgFile:
+                    for key, value in ConfigParser(cfgFile).parse():
+                        merged[key].append(value)
             except Exception as ex:
                 logging.error('Failed to parse configuration file: %r', ex)
                 raise
 
-            # options are returned as a list of (key, value) pairs, there will be
-            # more than one key appearance for some options, merge this together and
-            # make a dict out of it
-            options.sort()
-            options = dict((key, _options(group)) for key, group
-                           in itertools.groupby(options, lambda pair: pair[0]))
-
             # in partitioner config files loaded earlier have higher priority
             # (options are not overwritten by later configs), do the same here
-            for k, v in options.items():
+            for k, values in merged.items():
                 if k not in self:
-                    self[k] = v
+                    self[k] = values[0] if len(values) == 1 else values
+
+        # options never change after construction, so the table kind tests
+        # can be computed once instead of on every property access
+        self._isRefMatch = 'part.pos1' in self and 'part.pos2' in self
+        self._partitioned = 'part.pos' in self or 'part.pos1' in self
+        self._isSubChunked = self._partitioned and bool(int(self.get('part.subChunks', 1)))
+        self._isView = bool(self.get('view', False))
+
+        # table kind, used to dispatch CSS table option building
+        if self._isRefMatch:
+            self._kind = 'refMatch'
+        elif self._partitioned:
+            self._kind = 'partitioned'
+        else:
+            self._kind = 'plain'
+
+        # immutable snapshot of the contents, this is what makes instances
+        # hashable so that configs shared by many tables can be used as
+        # cache keys (list values are frozen as tuples)
+        self._frozenItems = frozenset((key, tuple(value) if isinstance(value, list) else value)
+                                      for key, value in self.items())
+
+        # lazily computed CSS option dictionaries
+        self._cssDbOptions = None
+        self._cssTableOptions = None
 
         # check that we have a set of required options defined
         missing = [key for key in self.requiredConfigKeys if key not in self]
@@ -117,7 +131,7 @@ class PartConfig(dict):
     @property
     def partitioned(self):
         """Returns True if table is partitioned"""
-        return 'part.pos' in self or 'part.pos1' in self
+        return self._partitioned
 
     @property
     def isSubChunked(self):
@@ -125,17 +139,17 @@ class PartConfig(dict):
         Returns True if table is sub-chunked. By default all partitioned tables
         are sub-chunked unles part.subChunks is set to 0
         """
-        return self.partitioned and bool(int(self.get('part.subChunks', 1)))
+        return self._isSubChunked
 
     @property
     def isRefMatch(self):
         """Returns True if table is a match table"""
-        return 'part.pos1' in self and 'part.pos2' in self
+        return self._isRefMatch
 
     @property
     def isView(self):
         """Returns True if table is a view"""
-        return bool(self.get('view', False))
+        return self._isView
 
     def isDirector(self, dbName, tableName):
         """
@@ -145,54 +159,87 @@ class PartConfig(dict):
         """
         return not self.isRefMatch and dbName == self['dirDb'] and tableName == self['dirTable']
 
+    def __hash__(self):
+        """
+        Hash is based on the snapshot of the options taken at construction
+        time, configs with identical contents hash identically.
+        """
+        return hash(self._frozenItems)
+
     def cssDbOptions(self):
         """
         Returns dictionary of CSS options for database.
         """
-        options = {'partitioningStrategy': "sphBox",
-                   'nStripes': int(self['part.num-stripes']),
-                   'nSubStripes': int(self['part.num-sub-stripes']),
-                   'overlap': float(self['part.default-overlap']),
-                   'storageClass': self.get('storageClass', 'L2')
-                   }
-        return options
+        if self._cssDbOptions is None:
+            self._cssDbOptions = {'partitioningStrategy': "sphBox",
+                                  'nStripes': int(self['part.num-stripes']),
+                                  'nSubStripes': int(self['part.num-sub-stripes']),
+                                  'overlap': float(self['part.default-overlap']),
+                                  'storageClass': self.get('storageClass', 'L2')
+                                  }
+        # return a copy so that callers cannot corrupt the cache
+        return dict(self._cssDbOptions)
 
     def cssTableOptions(self):
         """
         Returns dictionary of CSS options for a table.
         """
+        if self._cssTableOptions is None:
+            self._cssTableOptions = self._makeCssTableOptions()
+        # return a copy so that callers cannot corrupt the cache
+        return dict(self._cssTableOptions)
+
+    def _makeCssTableOptions(self):
+        """
+        Build dictionary of CSS options for a table, called once per instance.
+        Kind-specific options come from the builder selected via _kindOptions.
+        """
         options = {'compression': False,
                    'match': False
                    }
+        options.update(self._kindOptions[self._kind](self))
+        return options
 
-        if self.isRefMatch:
-
-            # refmatch table
-            options['match'] = True
-            options['dirTable1'] = self['dirTable1']
-            options['dirColName1'] = self['dirColName1']
-            options['dirTable2'] = self['dirTable2']
-            options['dirColName2'] = self['dirColName2']
-            options['flagColName'] = self['flagColName']
-            options['subChunks'] = int(self.get('part.subChunks', 1))
-
-        elif self.partitioned:
-
-            # partitioned table
-            pos = self['part.pos'].split(',')
-            raCol, declCol = pos[0].strip(), pos[1].strip()
-            options['latColName'] = declCol
-            options['lonColName'] = raCol
-            options['overlap'] = float(self['part.overlap'])
-            options['subChunks'] = bool(int(self.get('part.subChunks', 1)))
-            options['dirDb'] = self['dirDb']
-            options['dirTable'] = self['dirTable']
-            options['lockInMem'] = bool(self.get('sharedScan.lockInMem', False))
-            options['scanRating'] = int(self.get('sharedScan.scanRating', 0))
-            if 'dirColName' in self:
-                options['dirColName'] = self['dirColName']
-            else:
-                # for director table use id column name instead
-                options['dirColName'] = self['id']
+    def _refMatchOptions(self):
+        """
+        Returns CSS options specific to refmatch tables.
+        """
+        return {'match': True,
+                'dirTable1': self['dirTable1'],
+                'dirColName1': self['dirColName1'],
+                'dirTable2': self['dirTable2'],
+                'dirColName2': self['dirColName2'],
+                'flagColName': self['flagColName'],
+                'subChunks': int(self.get('part.subChunks', 1))
+                }
+
+    def _partitionedOptions(self):
+        """
+        Returns CSS options specific to partitioned non-refmatch tables.
+        """
+        pos = self['part.pos'].split(',')
+        raCol, declCol = pos[0].strip(), pos[1].strip()
+        # for director table use id column name instead of dirColName
+        dirColName = self['dirColName'] if 'dirColName' in self else self['id']
+        return {'latColName': declCol,
+                'lonColName': raCol,
+                'overlap': float(self['part.overlap']),
+                'subChunks': bool(int(self.get('part.subChunks', 1))),
+                'dirDb': self['dirDb'],
+                'dirTable': self['dirTable'],
+                'lockInMem': bool(self.get('sharedScan.lockInMem', False)),
+                'scanRating': int(self.get('sharedScan.scanRating', 0)),
+                'dirColName': dirColName
+                }
+
+    def _plainOptions(self):
+        """
+        Non-partitioned tables have no extra CSS options.
+        """
+        return {}
 
-        return options
+    # maps table kind to the builder of kind-specific CSS table options
+    _kindOptions = {'refMatch': _refMatchOptions,
+                    'partitioned': _partitionedOptions,
+                    'plain': _plainOptions
+                    }
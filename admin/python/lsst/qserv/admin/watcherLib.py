@@ -304,17 +304,26 @@ class Watcher(object):
             if sleep > 0:
                 time.sleep(sleep)
 
-    def _createDb(self, dbName, options):
-        """
-        Create new database on all nodes.
+    def _runAction(self, action, setStatus, dropItem, names, options):
         """
+        Call executor action and update CSS according to its result.
 
-        _LOG.info('Creating database %s', dbName)
+        All four action methods below share the same status-handling
+        logic, they only differ in the pre-bound executor and CSS methods
+        passed to this helper.
 
-        # call executor to perform action
+        @param action:    executor method performing the action
+        @param setStatus: wcss method used to update item status in CSS
+        @param dropItem:  wcss method used to drop item from CSS, None for
+                          create actions, on success the item is dropped
+                          instead of having its status set
+        @param names:     tuple with database name or database and table names
+        @param options:   options string passed to the action
+        """
+        item = '.'.join(names)
         try:
-            if self.executor.createDb(dbName, options):
-                status = css.KEY_STATUS_READY
+            if action(*(names + (options,))):
+                status = True if dropItem is not None else css.KEY_STATUS_READY
             else:
                 status = None
         except Exception as exc:
@@ -323,84 +332,44 @@ class Watcher(object):
             raise
         finally:
             # update CSS
-            if status is not None:
-                _LOG.info('Set CSS status for database %s = %s', dbName, status)
-                self.wcss.setDbStatus(dbName, status)
+            if status is True:
+                _LOG.info('Drop %s from CSS', item)
+                dropItem(*names)
+            elif status is not None:
+                _LOG.info('Set CSS status for %s = %s', item, status)
+                setStatus(*(names + (status,)))
+
+    def _createDb(self, dbName, options):
+        """
+        Create new database on all nodes.
+        """
+        _LOG.info('Creating database %s', dbName)
+        self._runAction(self.executor.createDb, self.wcss.setDbStatus, None,
+                        (dbName,), options)
 
     def _dropDb(self, dbName, options):
         """
         Drop existing database on all nodes.
         """
-
         _LOG.info('Dropping database %s', dbName)
-
-        # call executor to perform action
-        try:
-            if self.executor.dropDb(dbName, options):
-                status = True
-            else:
-                status = None
-        except Exception as exc:
-            _LOG.error('Failure in executor: %s', exc)
-            status = css.KEY_STATUS_FAILED_PFX + str(exc)
-            raise
-        finally:
-            if status is True:
-                # update CSS
-                _LOG.info('Drop database %s from CSS', dbName)
-                self.wcss.dropDb(dbName)
-            elif status is not None:
-                _LOG.info('Set CSS status for database %s = %s', dbName, status)
-                self.wcss.setDbStatus(dbName, status)
+        self._runAction(self.executor.dropDb, self.wcss.setDbStatus, self.wcss.dropDb,
+                        (dbName,), options)
 
     def _createTable(self, dbName, tableName, options):
         """
-        Create new database on all nodes.
+        Create new table on all nodes.
         """
-
         _LOG.info('Creating table %s.%s', dbName, tableName)
-
-        # call executor to perform action
-        try:
-            if self.executor.createTable(dbName, tableName, options):
-                status = css.KEY_STATUS_READY
-            else:
-                status = None
-        except Exception as exc:
-            _LOG.error('Failure in executor: %s', exc)
-            status = css.KEY_STATUS_FAILED_PFX + str(exc)
-            raise
-        finally:
-            # update CSS
-            if status is not None:
-                _LOG.info('Set CSS status for table %s.%s = %s', dbName, tableName, status)
-                self.wcss.setTableStatus(dbName, tableName, status)
+        self._runAction(self.executor.createTable, self.wcss.setTableStatus, None,
+                        (dbName, tableName), options)
 
     def _dropTable(self, dbName, tableName, options):
         """
-        Drop existing database on all nodes.
+        Drop existing table on all nodes.
         """
-
         _LOG.info('Dropping table %s.%s', dbName, tableName)
-
-        # call executor to perform action
-        try:
-            if self.executor.dropTable(dbName, tableName, options):
-                status = True
-            else:
-                status = None
-        except Exception as exc:
-            _LOG.error('Failure in executor: %s', exc)
-            status = css.KEY_STATUS_FAILED_PFX + str(exc)
-            raise
-        finally:
-            if status is True:
-                # update CSS
-                _LOG.info('Drop table %s.%s from CSS', dbName, tableName)
-                self.wcss.dropTable(dbName, tableName)
-            elif status is not None:
-                _LOG.info('Set CSS status for table %s.%s = %s', dbName, tableName, status)
-                self.wcss.setTableStatus(dbName, tableName, status)
+        self._runAction(self.executor.dropTable, self.wcss.setTableStatus, self.wcss.dropTable,
+                        (dbName, tableName), options)
 
 
 class QservExecutor(IExecutor):
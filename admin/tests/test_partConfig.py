@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+# LSST Data Management System
+# Copyright 2013-2014 AURA/LSST.
+#
+# This product includes software developed by the
+# LSST Project (http://www.lsst.org/).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the LSST License Statement and
+# the GNU General Public License along with this program.  If not,
+# see <http://www.lsstcorp.org/LegalNotices/>.
+
+"""
+This is a unittest for partConfig
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from lsst.qserv.admin.partConfig import PartConfig
+
+
+# common options for partitioned non-refMatch tables
+_partCfg = """\
+part = {
+    num-stripes = 10
+    num-sub-stripes = 6
+    default-overlap = 0.01
+    overlap = 0.025
+    pos = 'ra, decl'
+}
+dirDb = TestDb
+dirTable = Object
+id = objectId
+"""
+
+
+class TestPartConfig(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpDir, ignore_errors=True)
+
+    def _makeConfig(self, data, name='table.cfg'):
+        path = os.path.join(self._tmpDir, name)
+        with open(path, 'w') as cfg:
+            cfg.write(data)
+        return path
+
+    def testMerge(self):
+        """Repeated keys must be merged into a list of values"""
+
+        data = _partCfg + "in.csv = { field = a, field = b, field = c }\n"
+        config = PartConfig([self._makeConfig(data)])
+
+        self.assertEqual(config['part.num-stripes'], '10')
+        self.assertEqual(config['in.csv.field'], ['a', 'b', 'c'])
+
+    def testPriority(self):
+        """Options from earlier config files must win"""
+
+        override = "dirDb = OtherDb\n"
+        files = [self._makeConfig(override, 'first.cfg'),
+                 self._makeConfig(_partCfg, 'second.cfg')]
+        config = PartConfig(files)
+
+        self.assertEqual(config['dirDb'], 'OtherDb')
+        self.assertEqual(config['dirTable'], 'Object')
+
+    def testMissingKeys(self):
+        """Missing required options must raise KeyError"""
+
+        data = "part = { pos = 'ra, decl' }\n"
+        self.assertRaises(KeyError, PartConfig, [self._makeConfig(data)])
+
+    def testProperties(self):
+
+        config = PartConfig([self._makeConfig(_partCfg)])
+        self.assertTrue(config.partitioned)
+        self.assertTrue(config.isSubChunked)
+        self.assertFalse(config.isRefMatch)
+        self.assertFalse(config.isView)
+        self.assertTrue(config.isDirector('TestDb', 'Object'))
+        self.assertFalse(config.isDirector('TestDb', 'Source'))
+
+        data = _partCfg + "part.subChunks = 0\n"
+        config = PartConfig([self._makeConfig(data)])
+        self.assertTrue(config.partitioned)
+        self.assertFalse(config.isSubChunked)
+
+    def testCssTableOptions(self):
+
+        config = PartConfig([self._makeConfig(_partCfg)])
+        options = config.cssTableOptions()
+
+        self.assertFalse(options['match'])
+        self.assertEqual(options['lonColName'], 'ra')
+        self.assertEqual(options['latColName'], 'decl')
+        self.assertEqual(options['overlap'], 0.025)
+        self.assertTrue(options['subChunks'])
+        self.assertEqual(options['dirDb'], 'TestDb')
+        self.assertEqual(options['dirTable'], 'Object')
+        self.assertEqual(options['dirColName'], 'objectId')
+
+    def testHashable(self):
+        """Configs are hashable and repeated option calls agree"""
+
+        config = PartConfig([self._makeConfig(_partCfg)])
+        cache = {config: config.cssTableOptions()}
+
+        self.assertEqual(cache[config], config.cssTableOptions())
+        self.assertEqual(config.cssDbOptions(), config.cssDbOptions())
+
+    def testCssDbOptions(self):
+
+        config = PartConfig([self._makeConfig(_partCfg)])
+        options = config.cssDbOptions()
+
+        self.assertEqual(options['nStripes'], 10)
+        self.assertEqual(options['nSubStripes'], 6)
+        self.assertEqual(options['overlap'], 0.01)
+        self.assertEqual(options['storageClass'], 'L2')
+
+
+#
+
+if __name__ == "__main__":
+    unittest.main()
@@ -269,6 +269,8 @@ class WmgrClient(object):
         if self.host == 'localhost':
             self.host = '127.0.0.1'
         self.port = port
+        # host and port never change, format URL prefix once
+        self._baseUrl = 'http://{0}:{1}'.format(self.host, self.port)
         self.auth = None
         if user is not None or passwd is not None:
             if auth == 'basic':
@@ -643,7 +645,7 @@ class WmgrClient(object):
         """
         Returns initial part of service URL.
         """
-        return 'http://{0}:{1}'.format(self.host, self.port)
+        return self._baseUrl
 
     def _request(self, svc, resource, method='GET', params=None, data=None, headers=None):
         """